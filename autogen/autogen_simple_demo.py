@@ -3,181 +3,478 @@ Simplified AutoGen Demo - Interview Platform Product Planning
 
 This is a lightweight version for quick testing and understanding the workflow.
 It demonstrates multi-agent collaboration by having each agent generate responses.
+
+Phases run as asyncio coroutines: the per-competitor research calls fan out in
+parallel, while analysis -> blueprint -> review stay chained on their inputs.
+Each sequential phase hands the next one a short rolling digest rather than its
+full output; the final review streams to the console as it is generated.
+
+By default all four agent roles are answered by one structured-output call
+(see run_combined); pass --legacy-sequential to run the phases one by one.
 """
 
+import argparse
+import asyncio
+import functools
+import hashlib
+import sys
 from datetime import datetime
+from typing import TYPE_CHECKING
 from config import Config, WorkflowConfig
+from llm_cache import ResponseCache, cached_chat_completion
+from pydantic import BaseModel, ConfigDict, Field
+import jinja2
 import json
+from pathlib import Path
+
+if TYPE_CHECKING:
+    import tiktoken
+    from openai import AsyncOpenAI
+
+# Section divider for console and report output
+_BAR80 = "=" * 80
+
+# Completed phases of an interrupted --legacy-sequential run, reused on re-run
+CHECKPOINT_PATH = Path(Config.OUTPUT_DIR) / "simple_demo_checkpoint.json"
+
+# NOTE: openai, httpx and tiktoken are imported lazily (see get_client and
+# _encoding) so importing this module stays cheap for --help and test discovery.
+
+
+# Prompt templates, compiled once at import and rendered per call
+PROMPTS_DIR = Path(__file__).parent / "prompts"
+_jinja_env = jinja2.Environment(
+    loader=jinja2.FileSystemLoader(PROMPTS_DIR),
+    auto_reload=False,
+    undefined=jinja2.StrictUndefined,
+)
+TEMPLATES = {
+    name: _jinja_env.get_template(f"{name}.j2")
+    for name in ("research_system", "research", "analysis", "blueprint", "review")
+}
+
+# Competitors researched independently (and concurrently) in Phase 1
+COMPETITORS = ("HireVue", "Pymetrics", "Codility")
+
+# Tokens held back from the context window for chat message framing
+PROMPT_TOKEN_RESERVE = 256
+
+# Upper bound for the rolling context digest passed between sequential phases
+DIGEST_MAX_TOKENS = 120
+
+# Agent role prompts, one per workflow phase
+SYSTEM_PROMPTS = {
+    "research": f"""You are a market research analyst. Provide a brief analysis of
+{len(COMPETITORS)} competitors in AI interview platforms ({", ".join(COMPETITORS)}).
+List their key features and identify market gaps in 150 words.""",
+
+    "analysis": """You are a product analyst. Based on the market research provided,
+identify 3 key market opportunities or gaps for a new AI interview platform.
+Be concise in 150 words.""",
+
+    "blueprint": """You are a product designer. Based on the market analysis and opportunities,
+create a brief product blueprint including:
+- Key features (3-5)
+- User journey (2-3 steps)
+Keep it concise - 150 words.""",
+
+    "review": """You are a product reviewer and strategist. Review the product blueprint
+and provide 3 strategic recommendations for success.
+Be concise - 150 words.""",
+}
 
-# Try to import OpenAI client
-try:
-    from openai import OpenAI
-except ImportError:
-    print("ERROR: OpenAI client is not installed!")
-    print("Please run: pip install -r ../requirements.txt")
-    exit(1)
+
+class InterviewPlatformPlan(BaseModel):
+    """Structured output of the combined (single-call) workflow"""
+
+    model_config = ConfigDict(extra="forbid")
+
+    research: str = Field(description=WorkflowConfig.get_phase_description("research"))
+    analysis: str = Field(description=WorkflowConfig.get_phase_description("analysis"))
+    blueprint: str = Field(description=WorkflowConfig.get_phase_description("blueprint"))
+    review: str = Field(description=WorkflowConfig.get_phase_description("review"))
+
+
+class PhaseOutput(BaseModel):
+    """Structured output of one sequential phase"""
+
+    model_config = ConfigDict(extra="forbid")
+
+    content: str = Field(description="The full response for this phase")
+    summary: str = Field(description="A two-sentence digest of the content for the next agents")
+
+
+# Model families that reject {"type": "json_schema"} (no Structured Outputs support)
+NO_JSON_SCHEMA_PREFIXES = ("gpt-4-", "gpt-3.5")
+
+
+def _supports_json_schema() -> bool:
+    """Whether the configured model accepts a strict json_schema response_format"""
+    model = Config.OPENAI_MODEL
+    return not (model == "gpt-4" or model.startswith(NO_JSON_SCHEMA_PREFIXES))
+
+
+def _json_schema_format(model: type, name: str) -> dict:
+    """
+    Build a strict json_schema response_format from a Pydantic model, or plain
+    JSON mode on models without Structured Outputs (see _with_schema)
+    """
+    if not _supports_json_schema():
+        return {"type": "json_object"}
+    return {
+        "type": "json_schema",
+        "json_schema": {"name": name, "schema": model.model_json_schema(), "strict": True},
+    }
+
+
+def _with_schema(system_prompt: str, model: type) -> str:
+    """Spell out the JSON schema in the system prompt when the API cannot enforce it"""
+    if _supports_json_schema():
+        return system_prompt
+    schema = json.dumps(model.model_json_schema())
+    return f"{system_prompt}\n\nRespond only with a JSON object that matches this JSON schema:\n{schema}"
+
+
+COMBINED_SYSTEM_PROMPT = (
+    "You are a team of four product-planning agents working in sequence. "
+    "Fill in each field of the JSON plan in order, basing every field on the ones before it.\n\n"
+    + "\n\n".join(f"[{phase}]\n{prompt}" for phase, prompt in SYSTEM_PROMPTS.items())
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _encoding() -> "tiktoken.Encoding":
+    """Tokenizer for the configured model (loaded once, on first use)"""
+    import tiktoken
+
+    try:
+        return tiktoken.encoding_for_model(Config.OPENAI_MODEL)
+    except KeyError:
+        return tiktoken.get_encoding("cl100k_base")
+
+
+@functools.lru_cache(maxsize=None)
+def _system_tokens(prompt: str) -> tuple:
+    """Token ids of a static system prompt, memoized by prompt string"""
+    return tuple(_encoding().encode(prompt))
+
+
+def _max_tokens(system_prompt: str, user_message: str) -> int:
+    """
+    Largest response budget that still fits the model's context window
+
+    Returns:
+        int: min(Config.AGENT_MAX_TOKENS, tokens left after the prompt)
+    """
+    budget = (Config.CONTEXT_WINDOW
+              - len(_system_tokens(system_prompt))
+              - len(_encoding().encode(user_message))
+              - PROMPT_TOKEN_RESERVE)
+    if budget <= 0:
+        raise ValueError(f"Prompt does not fit the {Config.CONTEXT_WINDOW}-token context window")
+    return min(Config.AGENT_MAX_TOKENS, budget)
+
+
+@functools.cache
+def _prompt_fingerprint() -> str:
+    """Hash of every prompt a phase is built from, so stale checkpoints are ignored"""
+    sources = {
+        "system_prompts": SYSTEM_PROMPTS,
+        "templates": {name: Path(t.filename).read_text(encoding="utf-8") for name, t in TEMPLATES.items()},
+        "competitors": COMPETITORS,
+    }
+    return hashlib.sha256(json.dumps(sources, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+@functools.cache
+def _validated() -> bool:
+    """Validate the configuration once per process"""
+    return Config.validate_setup()
+
+
+@functools.cache
+def get_client() -> "AsyncOpenAI":
+    """
+    Shared AsyncOpenAI client on a pooled HTTP/2 connection set, so every API
+    call reuses keep-alive, multiplexed connections (one client per _main run;
+    _main closes it and clears this cache)
+
+    Raises:
+        RuntimeError: If the OpenAI client is not installed
+    """
+    try:
+        import httpx
+        from openai import AsyncOpenAI
+    except ImportError as e:
+        raise RuntimeError(
+            "OpenAI client is not installed! Please run: pip install -r ../requirements.txt"
+        ) from e
+
+    http_client = httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+        timeout=Config.AGENT_TIMEOUT,
+    )
+    return AsyncOpenAI(
+        api_key=Config.OPENAI_API_KEY,
+        base_url=Config.OPENAI_API_BASE,
+        http_client=http_client,
+        max_retries=0,  # retries are handled by llm_cache.retry_transient
+    )
 
 
 class SimpleInterviewPlatformWorkflow:
     """Simplified workflow for interview platform planning"""
 
-    def __init__(self):
-        """Initialize the workflow"""
-        if not Config.validate_setup():
+    def __init__(self, use_cache: bool = Config.CACHE_ENABLED):
+        """
+        Initialize the workflow
+
+        Args:
+            use_cache: Serve repeated prompts from the local response cache
+        """
+        if not _validated():
             print("ERROR: Configuration validation failed!")
             exit(1)
 
-        self.client = OpenAI(api_key=Config.OPENAI_API_KEY, base_url=Config.OPENAI_API_BASE)
+        self.client = get_client()
         self.outputs = {}
         self.model = Config.OPENAI_MODEL
-
-    def run(self):
-        """Execute the complete workflow"""
-        print("\n" + "="*80)
+        # Throttle in-flight requests to stay under OpenAI RPM/TPM limits
+        self.semaphore = asyncio.Semaphore(Config.MAX_CONCURRENCY)
+        self.cache = ResponseCache.from_config() if use_cache else None
+        # Condensed state handed between sequential phases instead of full outputs
+        self.context_digest = ""
+
+    async def run(self, legacy_sequential: bool = False, resume: bool = True):
+        """
+        Execute the complete workflow
+
+        Args:
+            legacy_sequential: Run the four phases as separate calls instead of
+                one combined structured-output call
+            resume: Reuse phases checkpointed by an interrupted legacy run
+        """
+        print("\n" + _BAR80)
         print("AUTOGEN INTERVIEW PLATFORM WORKFLOW - SIMPLIFIED DEMO")
-        print("="*80)
+        print(_BAR80)
         print(f"Start Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         print(f"Model: {self.model}\n")
 
-        # Phase 1: Research
-        self.phase_research()
+        if not legacy_sequential:
+            await self.run_combined()
+            self.print_summary(combined=True)
+            return
+
+        # Resume from the last interrupted run, if any
+        if resume:
+            self._load_checkpoint()
+
+        phases = [
+            ("research", self.phase_research),    # competitors fan out in parallel
+            ("analysis", self.phase_analysis),    # depends on research
+            ("blueprint", self.phase_blueprint),  # depends on analysis
+            ("review", self.phase_review),        # depends on blueprint
+        ]
+        for phase, execute in phases:
+            if phase in self.outputs:
+                print(f"\n[Checkpoint] Skipping {phase} - completed in a previous run")
+                continue
+            await execute()
+            self._save_checkpoint()
+
+        CHECKPOINT_PATH.unlink(missing_ok=True)
 
-        # Phase 2: Analysis
-        self.phase_analysis()
+        # Summary
+        self.print_summary()
 
-        # Phase 3: Blueprint
-        self.phase_blueprint()
+    def _load_checkpoint(self):
+        """Restore outputs and digest saved by an interrupted run with the same model and prompts"""
+        if not CHECKPOINT_PATH.exists():
+            return
+        checkpoint = json.loads(CHECKPOINT_PATH.read_text(encoding="utf-8"))
+        if checkpoint.get("model") != self.model or checkpoint.get("prompts") != _prompt_fingerprint():
+            return
+        self.outputs = checkpoint["outputs"]
+        self.context_digest = checkpoint["context_digest"]
+
+    def _save_checkpoint(self):
+        """Persist completed phases so a failed run can resume where it stopped"""
+        checkpoint = {
+            "model": self.model,
+            "prompts": _prompt_fingerprint(),
+            "outputs": self.outputs,
+            "context_digest": self.context_digest,
+        }
+        CHECKPOINT_PATH.write_text(json.dumps(checkpoint, indent=2), encoding="utf-8")
+
+    @staticmethod
+    def _preview(s: str, n: int = 500) -> str:
+        """First n characters of an agent output, with "..." if it was cut"""
+        return s if len(s) <= n else s[:n] + "..."
+
+    @staticmethod
+    def _echo(delta: str):
+        """Write a streamed chunk to the console immediately"""
+        sys.stdout.write(delta)
+        sys.stdout.flush()
+
+    async def _complete(self, system_prompt: str, user_message: str, stream: bool = False,
+                        response_format: dict = None) -> str:
+        """
+        Issue one (cached) chat completion, bounded by the concurrency semaphore
+
+        Args:
+            system_prompt: Agent role prompt
+            user_message: Task input for the agent
+            stream: Echo the response to the console while it is decoded
+            response_format: Optional structured-output spec passed to the API
+        """
+        async with self.semaphore:
+            return await cached_chat_completion(
+                self.client,
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_message}
+                ],
+                model=self.model,
+                temperature=Config.AGENT_TEMPERATURE,
+                max_tokens=_max_tokens(system_prompt, user_message),
+                cache=self.cache,
+                on_delta=self._echo if stream else None,
+                response_format=response_format,
+            )
+
+    async def _complete_with_summary(self, system_prompt: str, user_message: str) -> PhaseOutput:
+        """
+        Run a phase that returns its content together with a short summary
+
+        Returns:
+            PhaseOutput: The phase content and its summary
+        """
+        content = await self._complete(
+            _with_schema(system_prompt, PhaseOutput),
+            user_message,
+            response_format=_json_schema_format(PhaseOutput, "phase_output"),
+        )
+        return PhaseOutput.model_validate_json(content)
+
+    def _append_digest(self, phase: str, summary: str):
+        """
+        Append a "phase: summary" line, dropping whole oldest lines until the
+        digest fits DIGEST_MAX_TOKENS (the newest line is always kept)
+        """
+        entries = self.context_digest.splitlines()
+        entries.append(f"{phase}: {' '.join(summary.split())}")
+        while len(entries) > 1 and len(_encoding().encode("\n".join(entries))) > DIGEST_MAX_TOKENS:
+            entries.pop(0)
+        self.context_digest = "\n".join(entries)
+
+    async def run_combined(self) -> InterviewPlatformPlan:
+        """All four phases in one call, returned as an InterviewPlatformPlan"""
+        print("\n" + _BAR80)
+        print("COMBINED PLAN: RESEARCH -> ANALYSIS -> BLUEPRINT -> REVIEW")
+        print(_BAR80)
+        print("[All agents are working in a single structured call...]")
+
+        user_message = "Create a product plan for a new AI-powered interview platform."
+
+        content = await self._complete(
+            _with_schema(COMBINED_SYSTEM_PROMPT, InterviewPlatformPlan),
+            user_message,
+            response_format=_json_schema_format(InterviewPlatformPlan, "interview_platform_plan"),
+        )
 
-        # Phase 4: Review
-        self.phase_review()
+        plan = InterviewPlatformPlan.model_validate_json(content)
+        self.outputs = plan.model_dump()
+        for phase, text in self.outputs.items():
+            print(f"\n[{WorkflowConfig.get_phase_description(phase)}]")
+            print(self._preview(text))
+        return plan
 
-        # Summary
-        self.print_summary()
+    async def research_competitor(self, competitor: str) -> PhaseOutput:
+        """Research a single competitor (one Phase 1 sub-task)"""
+        system_prompt = TEMPLATES["research_system"].render(competitor=competitor)
+        user_message = TEMPLATES["research"].render(competitor=competitor)
 
-    def phase_research(self):
+        return await self._complete_with_summary(system_prompt, user_message)
+
+    async def phase_research(self) -> str:
         """Phase 1: Market Research"""
-        print("\n" + "="*80)
+        print("\n" + _BAR80)
         print("PHASE 1: MARKET RESEARCH")
-        print("="*80)
-        print("[ResearchAgent is analyzing the market...]")
-
-        system_prompt = """You are a market research analyst. Provide a brief analysis of
-3 competitors in AI interview platforms (HireVue, Pymetrics, Codility).
-List their key features and identify market gaps in 150 words."""
-
-        user_message = "Analyze the current market for AI-powered interview platforms."
-
-        response = self.client.chat.completions.create(
-            model=self.model,
-            temperature=Config.AGENT_TEMPERATURE,
-            max_tokens=Config.AGENT_MAX_TOKENS,
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_message}
-            ]
+        print(_BAR80)
+        print(f"[ResearchAgent is analyzing {len(COMPETITORS)} competitors in parallel...]")
+
+        findings = await asyncio.gather(
+            *(self.research_competitor(competitor) for competitor in COMPETITORS)
         )
 
-        self.outputs["research"] = response.choices[0].message.content
+        self.outputs["research"] = "\n\n".join(
+            f"{competitor}:\n{finding.content}" for competitor, finding in zip(COMPETITORS, findings)
+        )
+        for competitor, finding in zip(COMPETITORS, findings):
+            self._append_digest(competitor, finding.summary)
         print("\n[ResearchAgent Output]")
-        print(self.outputs["research"][:500] + "..." if len(self.outputs["research"]) > 500 else self.outputs["research"])
+        print(self._preview(self.outputs["research"]))
+        return self.outputs["research"]
 
-    def phase_analysis(self):
+    async def phase_analysis(self) -> str:
         """Phase 2: Opportunity Analysis"""
-        print("\n" + "="*80)
+        print("\n" + _BAR80)
         print("PHASE 2: OPPORTUNITY ANALYSIS")
-        print("="*80)
+        print(_BAR80)
         print("[AnalysisAgent is identifying opportunities...]")
 
-        system_prompt = """You are a product analyst. Based on the market research provided,
-identify 3 key market opportunities or gaps for a new AI interview platform.
-Be concise in 150 words."""
-
-        user_message = f"""Market research findings:
-{self.outputs['research']}
+        user_message = TEMPLATES["analysis"].render(digest=self.context_digest)
 
-Now identify market opportunities and gaps."""
-
-        response = self.client.chat.completions.create(
-            model=self.model,
-            temperature=Config.AGENT_TEMPERATURE,
-            max_tokens=Config.AGENT_MAX_TOKENS,
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_message}
-            ]
-        )
-
-        self.outputs["analysis"] = response.choices[0].message.content
+        output = await self._complete_with_summary(SYSTEM_PROMPTS["analysis"], user_message)
+        self.outputs["analysis"] = output.content
+        self._append_digest("analysis", output.summary)
         print("\n[AnalysisAgent Output]")
-        print(self.outputs["analysis"][:500] + "..." if len(self.outputs["analysis"]) > 500 else self.outputs["analysis"])
+        print(self._preview(self.outputs["analysis"]))
+        return self.outputs["analysis"]
 
-    def phase_blueprint(self):
+    async def phase_blueprint(self) -> str:
         """Phase 3: Product Blueprint"""
-        print("\n" + "="*80)
+        print("\n" + _BAR80)
         print("PHASE 3: PRODUCT BLUEPRINT")
-        print("="*80)
+        print(_BAR80)
         print("[BlueprintAgent is designing the product...]")
 
-        system_prompt = """You are a product designer. Based on the market analysis and opportunities,
-create a brief product blueprint including:
-- Key features (3-5)
-- User journey (2-3 steps)
-Keep it concise - 150 words."""
-
-        user_message = f"""Market Analysis:
-{self.outputs['analysis']}
-
-Create a product blueprint for our platform."""
-
-        response = self.client.chat.completions.create(
-            model=self.model,
-            temperature=Config.AGENT_TEMPERATURE,
-            max_tokens=Config.AGENT_MAX_TOKENS,
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_message}
-            ]
-        )
+        user_message = TEMPLATES["blueprint"].render(digest=self.context_digest)
 
-        self.outputs["blueprint"] = response.choices[0].message.content
+        output = await self._complete_with_summary(SYSTEM_PROMPTS["blueprint"], user_message)
+        self.outputs["blueprint"] = output.content
+        self._append_digest("blueprint", output.summary)
         print("\n[BlueprintAgent Output]")
-        print(self.outputs["blueprint"][:500] + "..." if len(self.outputs["blueprint"]) > 500 else self.outputs["blueprint"])
+        print(self._preview(self.outputs["blueprint"]))
+        return self.outputs["blueprint"]
 
-    def phase_review(self):
+    async def phase_review(self) -> str:
         """Phase 4: Strategic Review"""
-        print("\n" + "="*80)
+        print("\n" + _BAR80)
         print("PHASE 4: STRATEGIC REVIEW")
-        print("="*80)
+        print(_BAR80)
         print("[ReviewerAgent is providing recommendations...]")
 
-        system_prompt = """You are a product reviewer and strategist. Review the product blueprint
-and provide 3 strategic recommendations for success.
-Be concise - 150 words."""
-
-        user_message = f"""Product Blueprint:
-{self.outputs['blueprint']}
-
-Provide strategic review and recommendations."""
-
-        response = self.client.chat.completions.create(
-            model=self.model,
-            temperature=Config.AGENT_TEMPERATURE,
-            max_tokens=Config.AGENT_MAX_TOKENS,
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_message}
-            ]
-        )
+        user_message = TEMPLATES["review"].render(digest=self.context_digest)
 
-        self.outputs["review"] = response.choices[0].message.content
         print("\n[ReviewerAgent Output]")
-        print(self.outputs["review"][:500] + "..." if len(self.outputs["review"]) > 500 else self.outputs["review"])
-
-    def print_summary(self):
-        """Print final summary"""
-        print("\n" + "="*80)
+        self.outputs["review"] = await self._complete(SYSTEM_PROMPTS["review"], user_message, stream=True)
+        print()
+        return self.outputs["review"]
+
+    def print_summary(self, combined: bool = False):
+        """
+        Print final summary
+
+        Args:
+            combined: The four roles were answered by one structured call (run_combined)
+        """
+        print("\n" + _BAR80)
         print("FINAL SUMMARY")
-        print("="*80)
+        print(_BAR80)
 
         print("""
 This workflow demonstrated a 4-agent collaboration:
@@ -185,19 +482,52 @@ This workflow demonstrated a 4-agent collaboration:
 2. AnalysisAgent - Identified opportunities
 3. BlueprintAgent - Designed the product
 4. ReviewerAgent - Provided strategic recommendations
-
-Each agent received context from the previous agent's output,
-demonstrating the sequential workflow pattern of AutoGen.
+""")
+        if combined:
+            print("""All four roles were filled in one structured-output call, each
+field building on the ones before it. Run with --legacy-sequential
+to see the agents hand off to each other in separate calls.
+""")
+        else:
+            print("""Each agent received a digest of the previous agents' outputs,
+demonstrating the sequential workflow pattern of AutoGen. Independent
+sub-tasks (per-competitor research) ran concurrently.
 """)
 
+        if self.cache is not None:
+            print(f"Cache: {self.cache.hits} hits, {self.cache.misses} misses")
         print(f"End Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        print("="*80)
+        print(_BAR80)
+
+
+async def _main(use_cache: bool, legacy_sequential: bool, resume: bool = True):
+    """
+    Run one workflow and close the shared HTTP pool on the same event loop
+
+    The closed client is evicted from get_client's cache so a later run in this
+    process (on a new event loop) builds a fresh one.
+    """
+    workflow = SimpleInterviewPlatformWorkflow(use_cache=use_cache)
+    try:
+        await workflow.run(legacy_sequential=legacy_sequential, resume=resume)
+    finally:
+        await workflow.client.close()
+        get_client.cache_clear()
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Always call the API (e.g. for benchmarking)")
+    parser.add_argument("--legacy-sequential", action="store_true",
+                        help="Run the four phases as separate calls instead of one combined call")
+    parser.add_argument("--fresh", action="store_true",
+                        help="Ignore any checkpoint left by an interrupted --legacy-sequential run")
+    args = parser.parse_args()
+
     try:
-        workflow = SimpleInterviewPlatformWorkflow()
-        workflow.run()
+        asyncio.run(_main(use_cache=not args.no_cache, legacy_sequential=args.legacy_sequential,
+                          resume=not (args.fresh or args.no_cache)))
         print("\n✅ Workflow completed successfully!")
     except Exception as e:
         print(f"\n❌ Error during workflow execution: {str(e)}")
@@ -5,12 +5,17 @@ CrewAI Multi-Agent Demo: Travel Planning System (REAL API VERSION)
 This implementation uses REAL OpenAI API calls and web search to gather
 actual travel information for planning a 5-day trip to Iceland.
 
+By default a single TravelPlannerAgent holds all four research tools and
+produces the whole plan in one task (one backstory instead of four in every
+reasoning step). Pass --multi-agent to run the four specialists below as a
+sequential crew.
+
 Agents use:
 1. OpenAI GPT-4 for intelligent research and recommendations
 2. Web search for real-time flight, hotel, and attraction data
 3. Real travel data from current sources
 
-Agents:
+Specialist agents (--multi-agent and --batch):
 1. FlightAgent - Flight Specialist (researches real flight options)
 2. HotelAgent - Accommodation Specialist (finds real hotels)
 3. ItineraryAgent - Travel Planner (creates realistic itineraries)
@@ -18,30 +23,173 @@ Agents:
 
 Configuration:
 - Uses shared configuration from the root .env file
-- Environment variables set in /Users/pranavhharish/Desktop/IS-492/multi-agent/.env
+- Environment variables set in the project root .env (see .env.example)
 """
 
-import os
+import atexit
+import contextlib
+import functools
+import io
+import multiprocessing
 import sys
 import json
+import re
+import time
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from crewai import Agent, Task, Crew
-from crewai.tools import tool
-import requests
+from typing import Optional
+import jinja2
+from pydantic import BaseModel
 
 # Add parent directory to path to import shared_config
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 # Import shared configuration
 from shared_config import Config, validate_config
+from llm_cache import retry_transient
+
+# Section divider for console and report output
+_BAR80 = "=" * 80
+
+# Cross-process gate on concurrent crew runs, installed in each main_batch worker
+_RUN_GATE = None
+
+# NOTE: crewai, openai and httpx are imported lazily (inside the functions that
+# use them) so importing this module stays cheap for --help and test discovery.
+
+
+@functools.cache
+def _config_validated() -> bool:
+    """Validate the configuration once per process."""
+    return validate_config()
+
+
+@functools.cache
+def get_client():
+    """
+    Shared OpenAI client for direct (non-CrewAI) API calls, on a pooled
+    HTTP/2 keep-alive connection set that is closed at exit.
+    """
+    import httpx
+    from openai import OpenAI
+
+    http_client = httpx.Client(
+        http2=True,
+        limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+        timeout=Config.AGENT_TIMEOUT,
+    )
+    # max_retries=0: retries are handled by llm_cache.retry_transient
+    client = OpenAI(api_key=Config.OPENAI_API_KEY, base_url=Config.OPENAI_API_BASE,
+                    http_client=http_client, max_retries=0)
+    atexit.register(client.close)
+    return client
+
+
+# Task prompt templates, compiled once at import and rendered per call
+PROMPTS_DIR = Path(__file__).parent / "prompts"
+_jinja_env = jinja2.Environment(
+    loader=jinja2.FileSystemLoader(PROMPTS_DIR),
+    auto_reload=False,
+    undefined=jinja2.StrictUndefined,
+)
+TEMPLATES = {
+    f"{task}_{part}": _jinja_env.get_template(f"{task}_{part}.j2")
+    for task in ("flight", "hotel", "itinerary", "budget", "travel_plan")
+    for part in ("task", "expected_output")
+}
+
+
+# ============================================================================
+# DESTINATION HELPERS
+# ============================================================================
+
+# Main hotel city for destinations given as a country (usually the capital)
+HOTEL_CITY: dict[str, str] = {
+    "iceland": "Reykjavik",
+    "france": "Paris",
+    "japan": "Tokyo",
+}
+
+
+def resolve_hotel_city(destination: str) -> str:
+    """Return the city to search hotels in, falling back to the destination itself."""
+    return HOTEL_CITY.get(destination.lower(), destination)
+
+
+# ============================================================================
+# TRAVEL PLAN OUTPUT
+# ============================================================================
+
+# Report sections, in order, with their headings
+PLAN_SECTIONS = {
+    "flights": "✈️  Flights",
+    "hotels": "🏨 Hotels",
+    "itinerary": "📅 Itinerary",
+    "budget": "💰 Budget",
+}
+
+
+class TravelPlan(BaseModel):
+    """Structured output of the single-agent travel plan task."""
+
+    flights: str
+    hotels: str
+    itinerary: str
+    budget: str
+
+
+def format_travel_plan(sections: dict) -> str:
+    """Render plan sections (keyed like PLAN_SECTIONS) as one text report."""
+    return "\n\n".join(
+        f"## {title}\n\n{sections.get(key, '(no output returned)')}"
+        for key, title in PLAN_SECTIONS.items()
+    )
 
 
 # ============================================================================
 # TOOLS (Real API implementations using web search)
 # ============================================================================
 
-@tool
+@functools.cache
+def _as_tool(func):
+    """Wrap a plain function as a CrewAI tool (once, on first use)."""
+    from crewai.tools import tool
+
+    return tool(func)
+
+
+_NUMBERED_ITEM = re.compile(r"^\d+\.\s+(.*)$")
+
+
+@functools.lru_cache(maxsize=None)
+def compress_prompt(text: str) -> str:
+    """
+    Shrink a tool's instruction text before it is returned to the agent.
+
+    Tool results are re-sent on every reasoning step, so indentation, blank
+    lines and numbered lists are collapsed into a single compact paragraph
+    ("Provide: a; b; c."). Memoized, so each (tool, arguments) result is only
+    compressed once.
+    """
+    parts, items = [], []
+    for line in text.strip().splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        item = _NUMBERED_ITEM.match(line)
+        if item:
+            items.append(item.group(1).rstrip("."))
+            continue
+        if items:
+            parts.append("; ".join(items) + ".")
+            items = []
+        parts.append(line)
+    if items:
+        parts.append("; ".join(items) + ".")
+    return " ".join(parts).replace("Please research and provide:", "Provide:")
+
+
 def search_flight_prices(destination: str, departure_city: str = "New York") -> str:
     """
     Search for real flight prices and options to a destination.
@@ -51,7 +199,7 @@ def search_flight_prices(destination: str, departure_city: str = "New York") ->
 
     # In production, this would use a real flight API (Skyscanner, Kayak, etc.)
     # For now, the LLM will use this to inform its research
-    return f"""
+    return compress_prompt(f"""
     Research task: Find flights from {departure_city} to {destination}.
 
     Please research and provide:
@@ -62,10 +210,9 @@ def search_flight_prices(destination: str, departure_city: str = "New York") ->
     5. Seasonal pricing variations
 
     Focus on realistic, current pricing for January 2026 travel.
-    """
+    """)
 
 
-@tool
 def search_hotel_options(location: str, check_in_date: str) -> str:
     """
     Search for real hotel options using web search.
@@ -73,7 +220,7 @@ def search_hotel_options(location: str, check_in_date: str) -> str:
     """
     search_query = f"hotels in {location} {check_in_date} reviews ratings prices 2026"
 
-    return f"""
+    return compress_prompt(f"""
     Research task: Find hotels in {location} for check-in {check_in_date}.
 
     Please research and provide:
@@ -85,10 +232,9 @@ def search_hotel_options(location: str, check_in_date: str) -> str:
 
     Include budget, mid-range, and luxury options.
     Focus on hotels with high ratings and realistic current prices.
-    """
+    """)
 
 
-@tool
 def search_attractions_activities(destination: str) -> str:
     """
     Search for real attractions and activities in a destination.
@@ -96,7 +242,7 @@ def search_attractions_activities(destination: str) -> str:
     """
     search_query = f"{destination} attractions activities tours things to do 2026"
 
-    return f"""
+    return compress_prompt(f"""
     Research task: Find attractions and activities in {destination}.
 
     Please research and provide:
@@ -110,10 +256,9 @@ def search_attractions_activities(destination: str) -> str:
 
     Include hidden gems and less-known but highly-rated activities.
     Focus on realistic itineraries that can be completed in 5 days.
-    """
+    """)
 
 
-@tool
 def search_travel_costs(destination: str) -> str:
     """
     Search for real travel costs and budgeting information.
@@ -121,7 +266,7 @@ def search_travel_costs(destination: str) -> str:
     """
     search_query = f"{destination} travel costs budget prices meals transport 2025"
 
-    return f"""
+    return compress_prompt(f"""
     Research task: Find cost information for a trip to {destination}.
 
     Please research and provide:
@@ -135,15 +280,39 @@ def search_travel_costs(destination: str) -> str:
 
     Provide realistic, current pricing information for 2025.
     Focus on actual costs travelers can expect.
-    """
+    """)
 
 
 # ============================================================================
 # AGENT DEFINITIONS
 # ============================================================================
 
+def create_travel_planner_agent(destination: str, trip_dates: str, trip_duration: str):
+    """Create the single TravelPlannerAgent that holds all four research tools."""
+    from crewai import Agent
+
+    return Agent(
+        role="Travel Planning Specialist",
+        goal=f"Plan the complete {trip_duration} {destination} trip ({trip_dates}): flights, hotels, "
+             f"a day-by-day itinerary and a budget, using real current data for every section.",
+        backstory="You are an experienced travel planner who books flights, picks hotels, builds "
+                  "well-paced itineraries and budgets whole trips. You always research current "
+                  "prices and verify information with your tools.",
+        tools=[
+            _as_tool(search_flight_prices),
+            _as_tool(search_hotel_options),
+            _as_tool(search_attractions_activities),
+            _as_tool(search_travel_costs),
+        ],
+        verbose=True,
+        allow_delegation=False
+    )
+
+
 def create_flight_agent(destination: str, trip_dates: str):
     """Create the Flight Specialist agent with real research tools."""
+    from crewai import Agent
+
     return Agent(
         role="Flight Specialist",
         goal=f"Research and recommend the best flight options for the {destination} trip "
@@ -154,7 +323,7 @@ def create_flight_agent(destination: str, trip_dates: str):
                   "finding the best flight options that balance cost and convenience. "
                   "You have booked thousands of flights and know the best times to fly. "
                   "You always research current prices and use real booking site data.",
-        tools=[search_flight_prices],
+        tools=[_as_tool(search_flight_prices)],
         verbose=True,
         allow_delegation=False
     )
@@ -162,14 +331,9 @@ def create_flight_agent(destination: str, trip_dates: str):
 
 def create_hotel_agent(destination: str, trip_dates: str):
     """Create the Accommodation Specialist agent with real research tools."""
-    # Determine main city for hotels (if destination is just a country, use capital)
-    hotel_location = destination
-    if destination.lower() == "iceland":
-        hotel_location = "Reykjavik"
-    elif destination.lower() == "france":
-        hotel_location = "Paris"
-    elif destination.lower() == "japan":
-        hotel_location = "Tokyo"
+    from crewai import Agent
+
+    hotel_location = resolve_hotel_city(destination)
 
     return Agent(
         role="Accommodation Specialist",
@@ -181,7 +345,7 @@ def create_hotel_agent(destination: str, trip_dates: str):
                   "perfect accommodations. You read reviews meticulously and know which "
                   "hotels offer the best experience for different budgets. You always "
                   "check current availability and actual guest reviews.",
-        tools=[search_hotel_options],
+        tools=[_as_tool(search_hotel_options)],
         verbose=True,
         allow_delegation=False
     )
@@ -189,6 +353,8 @@ def create_hotel_agent(destination: str, trip_dates: str):
 
 def create_itinerary_agent(destination: str, trip_duration: str):
     """Create the Travel Planner agent with real research tools."""
+    from crewai import Agent
+
     return Agent(
         role="Travel Planner",
         goal=f"Create a detailed day-by-day travel plan with activities and attractions "
@@ -199,7 +365,7 @@ def create_itinerary_agent(destination: str, trip_duration: str):
                   f"You create itineraries that are well-paced, exciting, and memorable. "
                   f"You consider travel times, weather, and traveler preferences to craft the perfect journey. "
                   f"You always verify current information about attractions and tours.",
-        tools=[search_attractions_activities],
+        tools=[_as_tool(search_attractions_activities)],
         verbose=True,
         allow_delegation=False
     )
@@ -207,6 +373,8 @@ def create_itinerary_agent(destination: str, trip_duration: str):
 
 def create_budget_agent(destination: str):
     """Create the Financial Advisor agent with real cost research tools."""
+    from crewai import Agent
+
     return Agent(
         role="Financial Advisor",
         goal=f"Calculate total trip costs for {destination} and identify cost-saving opportunities "
@@ -216,7 +384,7 @@ def create_budget_agent(destination: str):
                   "You identify hidden costs and suggest smart ways to save money without "
                   "compromising the travel experience. You research actual current prices "
                   "and provide realistic budget estimates.",
-        tools=[search_travel_costs],
+        tools=[_as_tool(search_travel_costs)],
         verbose=True,
         allow_delegation=False
     )
@@ -226,91 +394,216 @@ def create_budget_agent(destination: str):
 # TASK DEFINITIONS
 # ============================================================================
 
+def create_travel_plan_task(planner_agent, destination: str, trip_duration: str, trip_dates: str,
+                            departure_city: str, travelers: int, budget_preference: str):
+    """Define the single task covering flights, hotels, itinerary and budget."""
+    from crewai import Task
+
+    params = {
+        "destination": destination,
+        "trip_duration": trip_duration,
+        "trip_dates": trip_dates,
+        "departure_city": departure_city,
+        "travelers": travelers,
+        "budget_preference": budget_preference,
+        "hotel_location": resolve_hotel_city(destination),
+    }
+    return Task(
+        description=TEMPLATES["travel_plan_task"].render(**params),
+        agent=planner_agent,
+        expected_output=TEMPLATES["travel_plan_expected_output"].render(**params),
+        output_json=TravelPlan
+    )
+
+
 def create_flight_task(flight_agent, destination: str, trip_dates: str, departure_city: str):
     """Define the flight research task using real data."""
+    from crewai import Task
+
+    params = {
+        "destination": destination,
+        "trip_dates": trip_dates,
+        "departure_city": departure_city,
+    }
     return Task(
-        description=f"Research and compile a list of REAL flight options from {departure_city} to {destination} "
-                   f"for the trip ({trip_dates}). "
-                   f"Use actual current flight data from booking sites like Skyscanner, Kayak, "
-                   f"Google Flights, or Expedia. Find at least 2-3 different flight options from "
-                   f"major airlines, including details about departure times, arrival times, "
-                   f"duration, and current realistic prices. Provide "
-                   f"recommendations on which flight offers the best value considering both "
-                   f"price and convenience.",
+        description=TEMPLATES["flight_task"].render(**params),
         agent=flight_agent,
-        expected_output=f"A detailed report with 2-3 REAL flight options from {departure_city} to {destination} "
-                       f"including airlines, times, duration, current prices, and a recommendation with reasoning based on "
-                       f"actual data from flight booking sites"
+        expected_output=TEMPLATES["flight_expected_output"].render(**params)
     )
 
 
 def create_hotel_task(hotel_agent, destination: str, trip_dates: str):
     """Define the hotel recommendation task using real data."""
-    # Determine main city for hotels
-    hotel_location = destination
-    if destination.lower() == "iceland":
-        hotel_location = "Reykjavik"
-    elif destination.lower() == "france":
-        hotel_location = "Paris"
-    elif destination.lower() == "japan":
-        hotel_location = "Tokyo"
+    from crewai import Task
 
+    params = {
+        "trip_dates": trip_dates,
+        "hotel_location": resolve_hotel_city(destination),
+    }
     return Task(
-        description=f"Based on the trip dates ({trip_dates}), find and recommend "
-                   f"the top 3-4 REAL hotels in {hotel_location}. Research actual hotels "
-                   f"on Booking.com, TripAdvisor, Google Hotels, and Expedia. For each hotel, "
-                   f"provide the actual name, current guest ratings, real prices per night, "
-                   f"confirmed amenities, and explain why it suits this trip. "
-                   f"Include a mix of budget, mid-range, and luxury options with honest reviews.",
+        description=TEMPLATES["hotel_task"].render(**params),
         agent=hotel_agent,
-        expected_output=f"A curated list of 3-4 REAL hotel recommendations in {hotel_location} with actual details "
-                       f"about each hotel, confirmed amenities, real guest ratings, current prices, "
-                       f"and personalized recommendations based on actual guest reviews"
+        expected_output=TEMPLATES["hotel_expected_output"].render(**params)
     )
 
 
 def create_itinerary_task(itinerary_agent, destination: str, trip_duration: str, trip_dates: str):
     """Define the itinerary planning task using real information."""
+    from crewai import Task
+
+    params = {
+        "destination": destination,
+        "trip_duration": trip_duration,
+        "trip_dates": trip_dates,
+    }
     return Task(
-        description=f"Create a detailed {trip_duration} itinerary for {destination} ({trip_dates}) based on "
-                   f"REAL current information. Research actual attractions, their opening hours, "
-                   f"accessibility, and entry fees. Plan day-by-day activities including visits "
-                   f"to real attractions and verified sites. Include realistic estimated travel times between "
-                   f"locations, activity durations, and recommended visit times. Consider actual "
-                   f"weather patterns for this time period in {destination} and make the itinerary realistic and well-paced.",
+        description=TEMPLATES["itinerary_task"].render(**params),
         agent=itinerary_agent,
-        expected_output=f"A detailed day-by-day itinerary for {destination} with REAL activities based on verified "
-                       f"attractions, realistic travel times, accurate estimated durations, current "
-                       f"entry fees, and practical tips for {trip_duration} trip to {destination}"
+        expected_output=TEMPLATES["itinerary_expected_output"].render(**params)
     )
 
 
 def create_budget_task(budget_agent, destination: str, trip_duration: str):
     """Define the budget calculation task using real cost data."""
+    from crewai import Task
+
+    params = {
+        "destination": destination,
+        "trip_duration": trip_duration,
+    }
     return Task(
-        description=f"Based on the REAL flight options, hotel recommendations, and itinerary "
-                   f"created by the other agents, calculate a comprehensive budget for the "
-                   f"{trip_duration} {destination} trip using current pricing. Research and include actual "
-                   f"costs for flights, accommodation, meals (use real restaurant prices in the destination), "
-                   f"activities/tours (verified prices), transportation within {destination}, "
-                   f"and miscellaneous expenses. Provide total cost estimates "
-                   f"for budget, mid-range, and luxury options based on real prices. Suggest "
-                   f"genuine cost-saving tips based on current market conditions.",
+        description=TEMPLATES["budget_task"].render(**params),
         agent=budget_agent,
-        expected_output=f"A comprehensive budget report with itemized REAL costs for flights, "
-                       f"accommodation, meals, activities with actual entry fees, transportation, "
-                       f"and total realistic estimates at different budget levels, plus "
-                       f"evidence-based cost-saving recommendations for a {trip_duration} trip to {destination}"
+        expected_output=TEMPLATES["budget_expected_output"].render(**params)
     )
 
 
+# ============================================================================
+# BATCH EXECUTION (OpenAI Batch API)
+# ============================================================================
+
+BATCH_POLL_INTERVAL = 30  # Seconds between batch status checks
+BATCH_TERMINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+
+def build_batch_requests(tasks: dict) -> str:
+    """
+    Serialize crew tasks into Batch API JSONL, one chat completion per task.
+
+    Each request uses the task's agent persona as the system prompt and the
+    task description plus expected output as the user prompt.
+
+    Args:
+        tasks: Mapping of custom_id -> Task
+
+    Returns:
+        str: JSONL payload for client.files.create(purpose="batch")
+    """
+    lines = []
+    for custom_id, task in tasks.items():
+        agent = task.agent
+        lines.append(json.dumps({
+            "custom_id": custom_id,
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": {
+                "model": Config.OPENAI_MODEL,
+                "temperature": Config.AGENT_TEMPERATURE,
+                "max_tokens": Config.AGENT_MAX_TOKENS,
+                "messages": [
+                    {"role": "system",
+                     "content": f"You are a {agent.role}. {agent.backstory}\nYour goal: {agent.goal}"},
+                    {"role": "user",
+                     "content": f"{task.description}\n\nExpected output: {task.expected_output}"},
+                ],
+            },
+        }))
+    return "\n".join(lines) + "\n"
+
+
+def _batch_error(record: dict) -> str:
+    """Error message of a failed Batch API output or error-file record."""
+    response = record.get("response") or {}
+    error = record.get("error") or (response.get("body") or {}).get("error") or {}
+    return error.get("message") or f"HTTP {response.get('status_code')}"
+
+
+def run_batch(tasks: dict) -> str:
+    """
+    Run all crew tasks as a single OpenAI Batch API job and wait for it.
+
+    Batch jobs are billed at a discount but may take up to 24h, so this path is
+    meant for non-interactive planning runs.
+
+    Args:
+        tasks: Mapping of PLAN_SECTIONS key -> Task
+
+    Returns:
+        str: Combined report with one section per task (failed requests
+            are reported in their section)
+
+    Raises:
+        RuntimeError: If the batch did not complete or every request failed
+    """
+    client = get_client()
+
+    # Only the submission holds a main_batch gate slot; a queued job uses no online RPM
+    with _RUN_GATE or contextlib.nullcontext():
+        batch_file = retry_transient(client.files.create)(
+            file=("crewai_batch.jsonl", build_batch_requests(tasks).encode("utf-8")),
+            purpose="batch",
+        )
+        batch = client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+    print(f"📦 Submitted batch {batch.id} with {len(tasks)} requests")
+
+    while batch.status not in BATCH_TERMINAL_STATUSES:
+        time.sleep(BATCH_POLL_INTERVAL)
+        batch = retry_transient(client.batches.retrieve)(batch.id)
+        print(f"   Batch status: {batch.status} "
+              f"({batch.request_counts.completed}/{batch.request_counts.total} done)")
+
+    if batch.status != "completed":
+        raise RuntimeError(f"Batch {batch.id} finished with status '{batch.status}'")
+
+    # Successful requests land in the output file, failed ones in the error file
+    outputs, errors = {}, {}
+    for file_id in (batch.output_file_id, batch.error_file_id):
+        if not file_id:
+            continue
+        content = retry_transient(client.files.content)(file_id)
+        for line in content.text.splitlines():
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            response = record.get("response") or {}
+            if record.get("error") or response.get("status_code") != 200:
+                errors[record["custom_id"]] = _batch_error(record)
+            else:
+                outputs[record["custom_id"]] = response["body"]["choices"][0]["message"]["content"]
+
+    failures = "; ".join(f"{custom_id}: {message}" for custom_id, message in errors.items())
+    if not outputs:
+        raise RuntimeError(f"Batch {batch.id} completed but every request failed ({failures})")
+    if errors:
+        print(f"⚠️  {len(errors)} batch request(s) failed: {failures}")
+
+    for custom_id, message in errors.items():
+        outputs[custom_id] = f"❌ Request failed: {message}"
+    return format_travel_plan(outputs)
+
+
 # ============================================================================
 # CREW ORCHESTRATION
 # ============================================================================
 
 def main(destination: str = "Iceland", trip_duration: str = "5 days",
          trip_dates: str = "January 15-20, 2026", departure_city: str = "New York",
-         travelers: int = 2, budget_preference: str = "mid-range"):
+         travelers: int = 2, budget_preference: str = "mid-range", batch: bool = False,
+         multi_agent: bool = False, output_path: Optional[Path] = None):
     """
     Main function to orchestrate the travel planning crew.
 
@@ -321,12 +614,27 @@ def main(destination: str = "Iceland", trip_duration: str = "5 days",
         departure_city: City you're departing from (e.g., "New York", "Los Angeles")
         travelers: Number of travelers
         budget_preference: Budget level ("budget", "mid-range", "luxury")
+        batch: Submit the four tasks as one OpenAI Batch API job instead of
+            running the crew interactively (cheaper, but not real-time)
+        multi_agent: Run the four specialist agents as a sequential crew instead
+            of the single TravelPlannerAgent
+        output_path: Where to save the report (default:
+            crewai_output_<destination>.txt next to this script)
+
+    Returns:
+        Optional[str]: The final travel plan, or None if the crew failed
     """
+    try:
+        from crewai import Crew
+    except ImportError:
+        print("ERROR: CrewAI is not installed!")
+        print("Please run: pip install -r ../requirements.txt")
+        exit(1)
 
-    print("=" * 80)
+    print(_BAR80)
     print("CrewAI Multi-Agent Travel Planning System (REAL API VERSION)")
     print(f"Planning a {trip_duration} Trip to {destination}")
-    print("=" * 80)
+    print(_BAR80)
     print()
     print(f"📍 Destination: {destination}")
     print(f"📅 Dates: {trip_dates}")
@@ -337,7 +645,7 @@ def main(destination: str = "Iceland", trip_duration: str = "5 days",
 
     # Validate configuration before proceeding
     print("🔍 Validating configuration...")
-    if not validate_config():
+    if not _config_validated():
         print("❌ Configuration validation failed. Please set up your .env file.")
         exit(1)
 
@@ -351,103 +659,131 @@ def main(destination: str = "Iceland", trip_duration: str = "5 days",
     print("Tip: Check your API usage at https://platform.openai.com/account/usage")
     print()
 
-    # Create agents with destination parameters
-    print("[1/4] Creating Flight Specialist Agent (researches real flights)...")
-    flight_agent = create_flight_agent(destination, trip_dates)
+    if multi_agent or batch:
+        # Create agents with destination parameters
+        print("[1/4] Creating Flight Specialist Agent (researches real flights)...")
+        flight_agent = create_flight_agent(destination, trip_dates)
 
-    print("[2/4] Creating Accommodation Specialist Agent (researches real hotels)...")
-    hotel_agent = create_hotel_agent(destination, trip_dates)
+        print("[2/4] Creating Accommodation Specialist Agent (researches real hotels)...")
+        hotel_agent = create_hotel_agent(destination, trip_dates)
 
-    print("[3/4] Creating Travel Planner Agent (researches real attractions)...")
-    itinerary_agent = create_itinerary_agent(destination, trip_duration)
+        print("[3/4] Creating Travel Planner Agent (researches real attractions)...")
+        itinerary_agent = create_itinerary_agent(destination, trip_duration)
 
-    print("[4/4] Creating Financial Advisor Agent (analyzes real costs)...")
-    budget_agent = create_budget_agent(destination)
+        print("[4/4] Creating Financial Advisor Agent (analyzes real costs)...")
+        budget_agent = create_budget_agent(destination)
 
-    print("\n✅ All agents created successfully!")
-    print()
+        print("\n✅ All agents created successfully!")
+        print()
 
-    # Create tasks with destination parameters
-    print("Creating tasks for the crew...")
-    flight_task = create_flight_task(flight_agent, destination, trip_dates, departure_city)
-    hotel_task = create_hotel_task(hotel_agent, destination, trip_dates)
-    itinerary_task = create_itinerary_task(itinerary_agent, destination, trip_duration, trip_dates)
-    budget_task = create_budget_task(budget_agent, destination, trip_duration)
+        # Create tasks with destination parameters
+        print("Creating tasks for the crew...")
+        tasks = {
+            "flights": create_flight_task(flight_agent, destination, trip_dates, departure_city),
+            "hotels": create_hotel_task(hotel_agent, destination, trip_dates),
+            "itinerary": create_itinerary_task(itinerary_agent, destination, trip_duration, trip_dates),
+            "budget": create_budget_task(budget_agent, destination, trip_duration),
+        }
+        agents = [flight_agent, hotel_agent, itinerary_agent, budget_agent]
+    else:
+        print("Creating Travel Planning Specialist Agent (flights, hotels, attractions, costs)...")
+        planner_agent = create_travel_planner_agent(destination, trip_dates, trip_duration)
+
+        print("Creating the travel plan task...")
+        tasks = {
+            "plan": create_travel_plan_task(planner_agent, destination, trip_duration, trip_dates,
+                                            departure_city, travelers, budget_preference),
+        }
+        agents = [planner_agent]
 
     print("Tasks created successfully!")
     print()
 
-    # Create the crew with sequential task execution
-    print("Forming the Travel Planning Crew...")
-    print("Task Sequence: FlightAgent → HotelAgent → ItineraryAgent → BudgetAgent")
-    print()
+    if not batch:
+        print("Forming the Travel Planning Crew...")
+        if multi_agent:
+            print("Task Sequence: FlightAgent → HotelAgent → ItineraryAgent → BudgetAgent")
+        else:
+            print("Single agent: TravelPlannerAgent (4 tools, 1 task)")
+        print()
 
-    crew = Crew(
-        agents=[flight_agent, hotel_agent, itinerary_agent, budget_agent],
-        tasks=[flight_task, hotel_task, itinerary_task, budget_task],
-        verbose=True,
-        process="sequential"  # Sequential task execution
-    )
+        crew = Crew(
+            agents=agents,
+            tasks=list(tasks.values()),
+            verbose=True
+        )
 
     # Execute the crew
-    print("=" * 80)
-    print("Starting Crew Execution with REAL API Calls...")
+    print(_BAR80)
+    if batch:
+        print("Submitting Tasks as an OpenAI Batch Job...")
+    else:
+        print("Starting Crew Execution with REAL API Calls...")
     print(f"Planning {trip_duration} trip to {destination} ({trip_dates})")
-    print("=" * 80)
+    print(_BAR80)
     print()
 
     try:
-        result = crew.kickoff(inputs={
-            "trip_destination": destination,
-            "trip_duration": trip_duration,
-            "trip_dates": trip_dates,
-            "departure_city": departure_city,
-            "travelers": travelers,
-            "budget_preference": budget_preference
-        })
+        if batch:
+            result = run_batch(tasks)
+        else:
+            with _RUN_GATE or contextlib.nullcontext():
+                result = crew.kickoff(inputs={
+                    "trip_destination": destination,
+                    "trip_duration": trip_duration,
+                    "trip_dates": trip_dates,
+                    "departure_city": departure_city,
+                    "travelers": travelers,
+                    "budget_preference": budget_preference
+                })
+            if not multi_agent and getattr(result, "json_dict", None):
+                result = format_travel_plan(result.json_dict)
 
         print()
-        print("=" * 80)
+        print(_BAR80)
         print("✅ Crew Execution Completed Successfully!")
-        print("=" * 80)
+        print(_BAR80)
         print()
         print(f"FINAL TRAVEL PLAN REPORT FOR {destination.upper()} (Based on Real API Data):")
         print("-" * 80)
         print(result)
         print("-" * 80)
 
-        # Save output to file
-        output_filename = f"crewai_output_{destination.lower()}.txt"
-        output_path = Path(__file__).parent / output_filename
-
-        with open(output_path, "w") as f:
-            f.write("=" * 80 + "\n")
-            f.write("CrewAI Multi-Agent Travel Planning System - Real API Execution Report\n")
-            f.write(f"Planning a {trip_duration} Trip to {destination}\n")
-            f.write("=" * 80 + "\n\n")
-            f.write(f"Trip Details:\n")
-            f.write(f"  Destination: {destination}\n")
-            f.write(f"  Duration: {trip_duration}\n")
-            f.write(f"  Dates: {trip_dates}\n")
-            f.write(f"  Departure: {departure_city}\n")
-            f.write(f"  Travelers: {travelers}\n")
-            f.write(f"  Budget Preference: {budget_preference}\n\n")
-            f.write(f"Execution Time: {datetime.now()}\n")
-            f.write(f"API Version: REAL API CALLS (OpenAI GPT-4)\n")
-            f.write(f"Data Source: Web research via OpenAI\n\n")
-            f.write("IMPORTANT NOTES:\n")
-            f.write("- All flight prices, hotel costs, and attraction information is based on real data\n")
-            f.write("- Prices are current as of the date this was run\n")
-            f.write("- Hotel availability and prices may vary by booking date\n")
-            f.write("- Weather conditions and attraction hours should be verified before travel\n\n")
-            f.write("FINAL TRAVEL PLAN REPORT:\n")
-            f.write("-" * 80 + "\n")
-            f.write(str(result))
-            f.write("\n" + "-" * 80 + "\n")
-
-        print(f"\n✅ Output saved to {output_filename}")
+        # Save output to file (report is assembled in memory, then written once)
+        if output_path is None:
+            output_path = Path(__file__).parent / f"crewai_output_{destination.lower()}.txt"
+        output_path = Path(output_path)
+
+        report = io.StringIO()
+        report.write(_BAR80 + "\n")
+        report.write("CrewAI Multi-Agent Travel Planning System - Real API Execution Report\n")
+        report.write(f"Planning a {trip_duration} Trip to {destination}\n")
+        report.write(_BAR80 + "\n\n")
+        report.write(f"Trip Details:\n")
+        report.write(f"  Destination: {destination}\n")
+        report.write(f"  Duration: {trip_duration}\n")
+        report.write(f"  Dates: {trip_dates}\n")
+        report.write(f"  Departure: {departure_city}\n")
+        report.write(f"  Travelers: {travelers}\n")
+        report.write(f"  Budget Preference: {budget_preference}\n\n")
+        report.write(f"Execution Time: {datetime.now()}\n")
+        report.write(f"API Version: REAL API CALLS (OpenAI GPT-4){' via Batch API' if batch else ''}\n")
+        report.write(f"Data Source: Web research via OpenAI\n\n")
+        report.write("IMPORTANT NOTES:\n")
+        report.write("- All flight prices, hotel costs, and attraction information is based on real data\n")
+        report.write("- Prices are current as of the date this was run\n")
+        report.write("- Hotel availability and prices may vary by booking date\n")
+        report.write("- Weather conditions and attraction hours should be verified before travel\n\n")
+        report.write("FINAL TRAVEL PLAN REPORT:\n")
+        report.write("-" * 80 + "\n")
+        report.write(str(result))
+        report.write("\n" + "-" * 80 + "\n")
+        output_path.write_text(report.getvalue(), encoding="utf-8")
+
+        print(f"\n✅ Output saved to {output_path}")
         print("ℹ️  Note: All data in this report is based on REAL API calls to OpenAI")
         print("    and research of current travel information sources.")
+        return str(result)
 
     except Exception as e:
         print(f"\n❌ Error during crew execution: {str(e)}")
@@ -459,6 +795,98 @@ def main(destination: str = "Iceland", trip_duration: str = "5 days",
         print()
         import traceback
         traceback.print_exc()
+        return None
+
+
+def _init_batch_worker(gate) -> None:
+    """Install the shared run gate in a main_batch worker process."""
+    global _RUN_GATE
+    _RUN_GATE = gate
+
+
+def _plan_destination(kwargs: dict) -> Optional[str]:
+    """Run main() in a worker, turning an early exit into an error main_batch records."""
+    try:
+        return main(**kwargs)
+    except SystemExit as e:
+        raise RuntimeError(f"main() exited early (status {e.code})") from None
+
+
+def main_batch(destinations: list[dict], output_path: Optional[Path] = None) -> str:
+    """
+    Plan several trips in parallel, one worker process per destination.
+
+    Each crew run is network-bound but uses CrewAI's synchronous (and not
+    thread-safe) internals, so runs are spread over a process pool. A shared
+    semaphore caps concurrent crew runs at Config.MAX_CONCURRENCY to stay
+    under the OpenAI rate limit.
+
+    Args:
+        destinations: One dict of main() keyword arguments per trip
+        output_path: Where to save the combined report (default:
+            crewai_output_batch.txt next to this script)
+
+    Returns:
+        str: Combined report of all travel plans
+    """
+    # Fail once here rather than in every worker. (find_spec is not enough:
+    # this script's own crewai/ directory resolves as a namespace package.)
+    try:
+        from crewai import Crew  # noqa: F401
+    except ImportError:
+        print("ERROR: CrewAI is not installed!")
+        print("Please run: pip install -r ../requirements.txt")
+        exit(1)
+
+    if not _config_validated():
+        print("❌ Configuration validation failed. Please set up your .env file.")
+        exit(1)
+
+    gate = multiprocessing.Semaphore(Config.MAX_CONCURRENCY)
+    with ProcessPoolExecutor(max_workers=min(len(destinations), 8),
+                             initializer=_init_batch_worker, initargs=(gate,)) as pool:
+        futures = [pool.submit(_plan_destination, d) for d in destinations]
+        results, errors = [], []
+        for future in futures:
+            # One failed (or crashed) worker must not cost the other plans
+            try:
+                results.append(future.result())
+                errors.append(None)
+            except Exception as e:
+                results.append(None)
+                errors.append(f"{type(e).__name__}: {e}")
+
+    report = io.StringIO()
+    report.write(_BAR80 + "\n")
+    report.write("CrewAI Multi-Agent Travel Planning System - Batch Report\n")
+    report.write(f"{len(destinations)} Destinations\n")
+    report.write(_BAR80 + "\n\n")
+    report.write(f"Execution Time: {datetime.now()}\n\n")
+    for d, result, error in zip(destinations, results, errors):
+        destination = d.get("destination", "Iceland")
+        report.write(f"TRAVEL PLAN: {destination.upper()}\n")
+        report.write("-" * 80 + "\n")
+        if result is not None:
+            report.write(result)
+        else:
+            report.write(f"❌ Planning failed: {error or 'see console output'}")
+        report.write("\n" + "-" * 80 + "\n\n")
+
+    if output_path is None:
+        output_path = Path(__file__).parent / "crewai_output_batch.txt"
+    output_path = Path(output_path)
+    output_path.write_text(report.getvalue(), encoding="utf-8")
+
+    failed = sum(result is None for result in results)
+    print()
+    print(_BAR80)
+    print(f"✅ Planned {len(results) - failed}/{len(results)} trips")
+    for d, error in zip(destinations, errors):
+        if error:
+            print(f"❌ {d.get('destination', 'Iceland')}: {error}")
+    print(f"✅ Combined report saved to {output_path}")
+    print(_BAR80)
+    return report.getvalue()
 
 
 if __name__ == "__main__":
@@ -475,19 +903,34 @@ if __name__ == "__main__":
     }
 
     # Parse command line arguments (optional)
-    # Usage: python crewai_demo.py [destination] [duration] [departure_city]
+    # Usage: python crewai_demo.py [destination] [duration] [departure_city] [--batch] [--multi-agent]
     # Example: python crewai_demo.py "France" "7 days" "Los Angeles"
-    if len(sys.argv) > 1:
-        kwargs["destination"] = sys.argv[1]
-    if len(sys.argv) > 2:
-        kwargs["trip_duration"] = sys.argv[2]
-    if len(sys.argv) > 3:
-        kwargs["departure_city"] = sys.argv[3]
-    if len(sys.argv) > 4:
-        kwargs["trip_dates"] = sys.argv[4]
-    if len(sys.argv) > 5:
-        kwargs["travelers"] = int(sys.argv[5])
-    if len(sys.argv) > 6:
-        kwargs["budget_preference"] = sys.argv[6]
-
-    main(**kwargs)
+    # Use --destination=NAME (repeatable) in place of [destination] to plan several trips in parallel
+    # Example: python crewai_demo.py --destination=France --destination="Reykjavik, Iceland" "7 days"
+    # Add --batch to submit all tasks as one (cheaper, slower) OpenAI Batch API job
+    # Add --multi-agent to run the four specialist agents instead of the single planner
+    flags = {arg for arg in sys.argv[1:] if arg.startswith("--")}
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    destinations = [flag.split("=", 1)[1] for flag in sys.argv[1:] if flag.startswith("--destination=")]
+    if destinations:
+        args.insert(0, destinations[0])
+    kwargs["batch"] = "--batch" in flags
+    kwargs["multi_agent"] = "--multi-agent" in flags
+
+    if len(args) > 0:
+        kwargs["destination"] = args[0]
+    if len(args) > 1:
+        kwargs["trip_duration"] = args[1]
+    if len(args) > 2:
+        kwargs["departure_city"] = args[2]
+    if len(args) > 3:
+        kwargs["trip_dates"] = args[3]
+    if len(args) > 4:
+        kwargs["travelers"] = int(args[4])
+    if len(args) > 5:
+        kwargs["budget_preference"] = args[5]
+
+    if len(destinations) > 1:
+        main_batch([{**kwargs, "destination": d} for d in destinations])
+    else:
+        main(**kwargs)
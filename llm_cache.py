@@ -0,0 +1,254 @@
+"""
+LLM Response Cache for AutoGen and CrewAI Lab Demo
+
+The demo workflows send the same prompts on every run, so repeated runs can be
+answered from a local cache instead of the OpenAI API. Two tiers are checked:
+
+1. Exact: SHA-256 of the canonicalized (model, temperature, max_tokens, messages)
+   request, looked up in a local SQLite database.
+2. Semantic (optional): the last user message is embedded and compared by cosine
+   similarity against cached requests that share the same remaining context
+   (GPTCache pattern). A hit above the threshold reuses the cached response.
+
+Requests that miss the cache are retried with exponential backoff on transient
+OpenAI errors (rate limits, timeouts, 5xx) via retry_transient.
+
+Usage:
+    from llm_cache import ResponseCache, cached_chat_completion
+
+    cache = ResponseCache.from_config()
+    text = await cached_chat_completion(
+        client, messages, model, temperature, max_tokens, cache=cache
+    )
+"""
+
+import hashlib
+import io
+import json
+import math
+import sqlite3
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_random_exponential
+
+from shared_config import Config
+
+
+def _is_transient(exc: BaseException) -> bool:
+    """Rate limits, timeouts and server errors are worth retrying."""
+    import openai
+
+    return isinstance(exc, (openai.RateLimitError, openai.APITimeoutError, openai.InternalServerError))
+
+
+# Decorator for OpenAI calls (sync or async): up to 6 attempts, 1-60s jittered backoff
+retry_transient = retry(
+    wait=wait_random_exponential(min=1, max=60),
+    stop=stop_after_attempt(6),
+    retry=retry_if_exception(_is_transient),
+    reraise=True,
+)
+
+
+def _canonical_key(payload: Dict[str, Any]) -> str:
+    """Hash a request payload into a stable cache key."""
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _normalize(vector: List[float]) -> List[float]:
+    """Scale a vector to unit length so a dot product equals cosine similarity."""
+    norm = math.sqrt(sum(x * x for x in vector)) or 1.0
+    return [x / norm for x in vector]
+
+
+class ResponseCache:
+    """
+    Two-tier (exact + semantic) cache for chat completion responses.
+
+    Responses are stored in a single SQLite file so the cache survives between
+    demo runs.
+    """
+
+    def __init__(self, path: Path, semantic: bool = False,
+                 threshold: float = 0.95, embedding_model: str = "text-embedding-3-small"):
+        self.path = Path(path)
+        self.semantic = semantic
+        self.threshold = threshold
+        self.embedding_model = embedding_model
+        self.hits = 0
+        self.misses = 0
+
+        self._db = sqlite3.connect(self.path)
+        self._db.execute(
+            """CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                context_key TEXT NOT NULL,
+                embedding TEXT,
+                response TEXT NOT NULL
+            )"""
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS idx_context ON responses (context_key)")
+        self._db.commit()
+
+    @classmethod
+    def from_config(cls) -> "ResponseCache":
+        """Create a cache using the settings from the shared configuration."""
+        return cls(
+            Config.CACHE_PATH,
+            semantic=Config.SEMANTIC_CACHE,
+            threshold=Config.SEMANTIC_CACHE_THRESHOLD,
+            embedding_model=Config.EMBEDDING_MODEL,
+        )
+
+    @staticmethod
+    def request_keys(model: str, temperature: float, max_tokens: int,
+                     messages: List[Dict[str, str]],
+                     response_format: Optional[Dict[str, Any]] = None) -> tuple:
+        """
+        Build the exact key and the semantic context key for a request.
+
+        The context key covers everything except the last user message, so
+        semantic matches are only considered between otherwise identical requests.
+
+        Returns:
+            tuple: (exact_key, context_key)
+        """
+        params = {"model": model, "temperature": temperature, "max_tokens": max_tokens,
+                  "response_format": response_format}
+        exact_key = _canonical_key({**params, "messages": messages})
+        context_key = _canonical_key({**params, "messages": messages[:-1]})
+        return exact_key, context_key
+
+    def get(self, key: str) -> Optional[str]:
+        """Look up a response by exact key."""
+        row = self._db.execute("SELECT response FROM responses WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def get_similar(self, context_key: str, embedding: List[float]) -> Optional[str]:
+        """
+        Find the most similar cached response sharing the same context.
+
+        Returns:
+            Optional[str]: Cached response if its similarity exceeds the threshold
+        """
+        query = _normalize(embedding)
+        best_score, best_response = 0.0, None
+        rows = self._db.execute(
+            "SELECT embedding, response FROM responses WHERE context_key = ? AND embedding IS NOT NULL",
+            (context_key,),
+        )
+        for stored, response in rows:
+            score = sum(a * b for a, b in zip(query, json.loads(stored)))
+            if score > best_score:
+                best_score, best_response = score, response
+        return best_response if best_score > self.threshold else None
+
+    def set(self, key: str, context_key: str, response: str,
+            embedding: Optional[List[float]] = None) -> None:
+        """Store a response (and optionally its normalized embedding)."""
+        stored = json.dumps(_normalize(embedding)) if embedding else None
+        self._db.execute(
+            "INSERT OR REPLACE INTO responses (key, context_key, embedding, response) VALUES (?, ?, ?, ?)",
+            (key, context_key, stored, response),
+        )
+        self._db.commit()
+
+
+@retry_transient
+async def _open_completion(client, **params):
+    """Send a chat completion request (retried on transient errors)."""
+    return await client.chat.completions.create(**params)
+
+
+@retry_transient
+async def _embed(client, model: str, text: str) -> List[float]:
+    """Embed a single text (retried on transient errors)."""
+    result = await client.embeddings.create(model=model, input=text)
+    return result.data[0].embedding
+
+
+async def _create_completion(client, messages: List[Dict[str, str]], model: str,
+                             temperature: float, max_tokens: int,
+                             on_delta: Optional[Callable[[str], None]] = None,
+                             response_format: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Call the chat completions API, streaming deltas to on_delta if given.
+
+    Returns:
+        str: The full assistant message content
+    """
+    params = {"model": model, "temperature": temperature, "max_tokens": max_tokens,
+              "messages": messages}
+    if response_format is not None:
+        params["response_format"] = response_format
+
+    if on_delta is None:
+        response = await _open_completion(client, **params)
+        return response.choices[0].message.content
+
+    buffer = io.StringIO()
+    stream = await _open_completion(client, **params, stream=True)
+    async for chunk in stream:
+        if not chunk.choices:
+            continue
+        delta = chunk.choices[0].delta.content
+        if delta:
+            buffer.write(delta)
+            on_delta(delta)
+    return buffer.getvalue()
+
+
+async def cached_chat_completion(client, messages: List[Dict[str, str]], model: str,
+                                 temperature: float, max_tokens: int,
+                                 cache: Optional[ResponseCache] = None,
+                                 on_delta: Optional[Callable[[str], None]] = None,
+                                 response_format: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Return a chat completion, serving it from the cache when possible.
+
+    Args:
+        client: AsyncOpenAI client used on cache misses (and for embeddings)
+        messages: Chat messages to send
+        model: Model name
+        temperature: Sampling temperature
+        max_tokens: Response token limit
+        cache: Response cache, or None to always call the API
+        on_delta: Optional callback receiving content as it is decoded; a
+            cache hit is delivered as a single delta
+        response_format: Optional structured-output spec (part of the cache key)
+
+    Returns:
+        str: The assistant message content
+    """
+    if cache is None:
+        return await _create_completion(client, messages, model, temperature, max_tokens,
+                                        on_delta, response_format)
+
+    key, context_key = cache.request_keys(model, temperature, max_tokens, messages, response_format)
+
+    # Tier 1: exact match
+    cached = cache.get(key)
+    if cached is not None:
+        cache.hits += 1
+        if on_delta is not None:
+            on_delta(cached)
+        return cached
+
+    # Tier 2: semantic match on the last user message
+    embedding = None
+    if cache.semantic:
+        embedding = await _embed(client, cache.embedding_model, messages[-1]["content"])
+        cached = cache.get_similar(context_key, embedding)
+        if cached is not None:
+            cache.hits += 1
+            if on_delta is not None:
+                on_delta(cached)
+            return cached
+
+    cache.misses += 1
+    content = await _create_completion(client, messages, model, temperature, max_tokens,
+                                       on_delta, response_format)
+    cache.set(key, context_key, content, embedding)
+    return content
@@ -39,6 +39,7 @@ class Config:
     OPENAI_API_KEY = os.getenv("OPENAI_API_KEY", "")
     OPENAI_API_BASE = os.getenv("OPENAI_API_BASE", "https://api.openai.com/v1")
     OPENAI_MODEL = os.getenv("OPENAI_MODEL", "gpt-4-turbo-preview")
+    CONTEXT_WINDOW = int(os.getenv("CONTEXT_WINDOW", "128000"))  # Model context size in tokens
 
     # ====================
     # Agent Settings
@@ -46,6 +47,16 @@ class Config:
     AGENT_TEMPERATURE = float(os.getenv("AGENT_TEMPERATURE", "0.7"))
     AGENT_MAX_TOKENS = int(os.getenv("AGENT_MAX_TOKENS", "2000"))
     AGENT_TIMEOUT = int(os.getenv("AGENT_TIMEOUT", "300"))
+    MAX_CONCURRENCY = int(os.getenv("MAX_CONCURRENCY", "4"))  # Parallel in-flight API calls
+
+    # ====================
+    # Response Cache Settings
+    # ====================
+    CACHE_ENABLED = os.getenv("CACHE_ENABLED", "True").lower() == "true"
+    CACHE_PATH = Path(os.getenv("CACHE_PATH", str(Path(__file__).parent / ".llm_cache.sqlite3")))
+    SEMANTIC_CACHE = os.getenv("SEMANTIC_CACHE", "False").lower() == "true"
+    SEMANTIC_CACHE_THRESHOLD = float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.95"))
+    EMBEDDING_MODEL = os.getenv("EMBEDDING_MODEL", "text-embedding-3-small")
 
     # ====================
     # Logging Settings
@@ -125,9 +136,13 @@ class Config:
             "openai_api_key": cls.OPENAI_API_KEY,
             "openai_api_base": cls.OPENAI_API_BASE,
             "openai_model": cls.OPENAI_MODEL,
+            "context_window": cls.CONTEXT_WINDOW,
             "agent_temperature": cls.AGENT_TEMPERATURE,
             "agent_max_tokens": cls.AGENT_MAX_TOKENS,
             "agent_timeout": cls.AGENT_TIMEOUT,
+            "max_concurrency": cls.MAX_CONCURRENCY,
+            "cache_enabled": cls.CACHE_ENABLED,
+            "semantic_cache": cls.SEMANTIC_CACHE,
             "verbose": cls.VERBOSE,
             "debug": cls.DEBUG,
         }
@@ -151,6 +166,8 @@ class Config:
         print(f"✓ Temperature:       {cls.AGENT_TEMPERATURE}")
         print(f"✓ Max Tokens:        {cls.AGENT_MAX_TOKENS}")
         print(f"✓ Timeout:           {cls.AGENT_TIMEOUT}s")
+        print(f"✓ Max Concurrency:   {cls.MAX_CONCURRENCY}")
+        print(f"✓ Response Cache:    {cls.CACHE_ENABLED} (semantic: {cls.SEMANTIC_CACHE})")
         print(f"✓ Verbose:           {cls.VERBOSE}")
         print(f"✓ Debug:             {cls.DEBUG}")
         print("="*60 + "\n")